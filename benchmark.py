@@ -0,0 +1,177 @@
+import os
+import sys
+import json
+import time
+import timeit
+import argparse
+import platform
+import tempfile
+import tracemalloc
+import numpy as np
+
+import BallsWaveGearingGenerator as core
+
+# Замеры: расчёт профиля, прореживание и построение QPainterPath предпросмотра (без окна) и запись DXF.
+# python benchmark.py -o results.json
+# python benchmark.py -o new.json --baseline results.json --threshold 0.2 --min-slowdown-ms 1
+
+RESOLUTIONS = (10 ** 2, 10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6)
+# (i, dsh); Rout подбирается чуть больше минимально допустимого
+GEARS = ((5, 3.0), (17, 6.0), (40, 4.0))
+STAGES = ("profile", "scene", "dxf_ezdxf", "dxf_stream")
+# tracemalloc не видит выделений Qt (C++) - пик памяти для этих этапов не записывается
+UNTRACED_STAGES = ("scene",)
+# ezdxf строит LWPOLYLINE за квадратичное время - большие RESOLUTION для него по умолчанию пропускаются
+EZDXF_MAX_RESOLUTION = 2 * 10 ** 4
+# QApplication для QPainterPath; ссылка хранится, пока идут замеры
+_app = None
+
+
+def design_Rout(i, dsh):
+    return round(float(core.calculate_dimensions(i, dsh, 0)["min_Rout"]) * 1.05, 2)
+
+
+def measure(fn, repeat, memory=True):
+    # Лучшее среднее время вызова из repeat серий и пиковый объём выделений Python/NumPy в отдельном запуске
+    # (None при memory=False).
+    # Число вызовов в серии подбирает autorange (серия не короче 0.2 с), чтобы микросекундные этапы
+    # не мерились одним вызовом. Прогрев: импорт ezdxf/Qt и первые выделения памяти не попадают в замер
+    fn()
+    timer = timeit.Timer(fn)
+    number, _ = timer.autorange()
+    best = min(timer.repeat(repeat=repeat, number=number)) / number
+    if not memory:
+        return best, None
+    tracemalloc.start()
+    try:
+        fn()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return best, peak
+
+
+def stage_function(stage, prof, D, out_path):
+    if stage == "profile":
+        return lambda: core.calculate_profile(prof["i"], prof["dsh"], prof["Rout"], len(prof["x"]))
+    if stage == "scene":
+        # Как plot_preview: профиль прореживается до полупикселя масштаба, при котором сцена с наружной
+        # окружностью D вписана в область предпросмотра, и только потом переводится в QPainterPath
+        from wave_reducer_gui import PREVIEW_MARGIN, PREVIEW_SIZE, profile_path
+        step = 0.5 * (D + 2 * PREVIEW_MARGIN) / PREVIEW_SIZE
+        return lambda: profile_path(*core.decimate_polyline(prof["x"], prof["y"], step))
+    backend = stage.split("_", 1)[1]
+    return lambda: core.write_dxf(out_path, prof, D, backend=backend)
+
+
+def run_benchmarks(resolutions=RESOLUTIONS, gears=GEARS, stages=STAGES, repeat=5,
+                   ezdxf_max_resolution=EZDXF_MAX_RESOLUTION):
+    global _app
+    if "scene" in stages:
+        # QPainterPath требует QGuiApplication; окно не показывается
+        os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+        from PyQt6.QtWidgets import QApplication
+        _app = QApplication.instance() or QApplication([])
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        out_path = os.path.join(tmp_dir, "benchmark.dxf")
+        for i, dsh in gears:
+            Rout = design_Rout(i, dsh)
+            D = Rout * 2 + 5
+            for resolution in resolutions:
+                prof = core.calculate_profile(i, dsh, Rout, resolution)
+                for stage in stages:
+                    record = {"stage": stage, "i": i, "dsh": dsh, "Rout": Rout, "resolution": resolution}
+                    if stage == "dxf_ezdxf" and resolution > ezdxf_max_resolution:
+                        record["skipped"] = True
+                    else:
+                        elapsed, peak = measure(stage_function(stage, prof, D, out_path), repeat,
+                                                memory=stage not in UNTRACED_STAGES)
+                        record["time_s"] = elapsed
+                        memory = "не измеряется"
+                        if peak is not None:
+                            record["peak_bytes"] = peak
+                            memory = f"{peak / 2 ** 20:9.2f} МБ"
+                        print(f"{stage:>10} i={i:<3} dsh={dsh:<5} RESOLUTION={resolution:<8} "
+                              f"{elapsed * 1000:10.2f} мс {memory}", file=sys.stderr)
+                    results.append(record)
+    return {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "repeat": repeat,
+        },
+        "results": results,
+    }
+
+
+def remeasure(records, repeat):
+    # Повторный замер отдельных записей (подозрений на регрессию); остаётся лучшее из двух времён
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        out_path = os.path.join(tmp_dir, "benchmark.dxf")
+        for record in records:
+            prof = core.calculate_profile(record["i"], record["dsh"], record["Rout"], record["resolution"])
+            elapsed, _ = measure(stage_function(record["stage"], prof, record["Rout"] * 2 + 5, out_path), repeat,
+                                 memory=False)
+            record["time_s"] = min(record["time_s"], elapsed)
+
+
+def result_key(record):
+    return record["stage"], record["i"], record["dsh"], record["resolution"]
+
+
+def compare(current, baseline, threshold, min_slowdown=0.001):
+    # Регрессия - время больше базового более чем на threshold (доля) и не меньше чем на min_slowdown (с):
+    # у микросекундных этапов относительный шум сам по себе превышает порог
+    base = {result_key(r): r for r in baseline["results"] if "time_s" in r}
+    regressions = []
+    for record in current["results"]:
+        old = base.get(result_key(record))
+        if old is None or "time_s" not in record:
+            continue
+        ratio = record["time_s"] / old["time_s"]
+        if ratio > 1 + threshold and record["time_s"] - old["time_s"] > min_slowdown:
+            regressions.append({**record, "baseline_time_s": old["time_s"], "ratio": ratio})
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Замеры производительности расчёта, предпросмотра и экспорта DXF.")
+    parser.add_argument("-o", "--output", default="benchmark_results.json", help="файл результатов (JSON)")
+    parser.add_argument("--resolutions", type=int, nargs="+", default=list(RESOLUTIONS))
+    parser.add_argument("--stages", nargs="+", choices=STAGES, default=list(STAGES))
+    parser.add_argument("--repeat", type=int, default=5, help="число серий замеров, берётся лучшее время")
+    parser.add_argument("--ezdxf-max-resolution", type=int, default=EZDXF_MAX_RESOLUTION)
+    parser.add_argument("--baseline", help="сравнить с сохранёнными результатами")
+    parser.add_argument("--threshold", type=float, default=0.2, help="допустимое замедление (0.2 = 20%%)")
+    parser.add_argument("--min-slowdown-ms", type=float, default=1.0,
+                        help="меньшие абсолютные замедления не считаются регрессией")
+    args = parser.parse_args(argv)
+
+    current = run_benchmarks(args.resolutions, GEARS, args.stages, args.repeat, args.ezdxf_max_resolution)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(current, f, ensure_ascii=False, indent=2)
+
+    if not args.baseline:
+        return 0
+    with open(args.baseline, encoding="utf-8") as f:
+        baseline = json.load(f)
+    regressions = compare(current, baseline, args.threshold, args.min_slowdown_ms / 1000)
+    if regressions:
+        # Единичный всплеск нагрузки на машине не должен считаться регрессией - перепроверяем только подозрения
+        keys = {result_key(r) for r in regressions}
+        remeasure([r for r in current["results"] if result_key(r) in keys], args.repeat)
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(current, f, ensure_ascii=False, indent=2)
+        regressions = compare(current, baseline, args.threshold, args.min_slowdown_ms / 1000)
+    for r in regressions:
+        print(f"Регрессия: {r['stage']} i={r['i']} dsh={r['dsh']} RESOLUTION={r['resolution']}: "
+              f"{r['baseline_time_s'] * 1000:.2f} -> {r['time_s'] * 1000:.2f} мс (x{r['ratio']:.2f})", file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,37 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import BallsWaveGearingGenerator as core
+
+
+def test_csv_with_bom_keeps_first_column(tmp_path):
+    # Excel сохраняет CSV с BOM в начале заголовка
+    table = tmp_path / "table.csv"
+    table.write_bytes("\ufeffi,dsh,Rout\r\n5,3,20\r\n40,4,80\r\n".encode("utf-8"))
+    rows = core.read_batch_table(str(table))
+    assert [row["i"] for row in rows] == [5, 40]
+
+
+def test_unknown_column_is_rejected(tmp_path):
+    table = tmp_path / "table.csv"
+    table.write_text("i,dhs,Rout\n5,3,20\n", encoding="utf-8")
+    with pytest.raises(ValueError, match="dhs"):
+        core.read_batch_table(str(table))
+
+
+def test_new_rows_do_not_regenerate_existing_files(tmp_path):
+    table = tmp_path / "table.csv"
+    out_dir = tmp_path / "out"
+    table.write_text("i,dsh,Rout\n17,6,38\n5,3,20\n", encoding="utf-8")
+    first = core.run_batch(str(table), str(out_dir), jobs=2)
+    assert first["generated"] == 2
+
+    # Дописанная строка не делает готовые файлы устаревшими; манифест в порядке таблицы
+    table.write_text("i,dsh,Rout\n17,6,38\n5,3,20\n40,4,80\n", encoding="utf-8")
+    second = core.run_batch(str(table), str(out_dir), jobs=2)
+    assert [row["status"] for row in second["rows"]] == ["skipped", "skipped", "generated"]
+    assert [row["params"]["i"] for row in second["rows"]] == [17, 5, 40]
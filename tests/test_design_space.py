@@ -0,0 +1,29 @@
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import BallsWaveGearingGenerator as core
+
+
+def test_feasibility_matches_min_Rout():
+    space = core.explore_design_space([5, 17, 40], np.linspace(1, 8, 15), np.linspace(10, 80, 71))
+    dims = core.calculate_dimensions(space["i_values"][:, None, None], space["dsh_values"][None, :, None],
+                                     space["Rout_values"][None, None, :])
+    assert np.array_equal(space["grid"]["feasible"], np.broadcast_to(dims["Rout"] > dims["min_Rout"],
+                                                                     space["grid"]["feasible"].shape))
+    assert "table" not in space
+
+
+def test_table_is_ranked_and_limited():
+    args = ([5, 17, 40], np.linspace(1, 8, 15), np.linspace(10, 80, 71))
+    full = core.explore_design_space(*args, max_D=150, limit=None)["table"]
+    top = core.explore_design_space(*args, max_D=150, limit=20)["table"]
+
+    # По возрастанию D, при равном D - по убыванию i
+    order = np.lexsort((-full["i"], full["D"]))
+    assert np.array_equal(order, np.arange(len(order)))
+    assert full["D"].max() <= 150
+    assert all(np.array_equal(top[key], full[key][:20]) for key in full)
@@ -0,0 +1,40 @@
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import BallsWaveGearingGenerator as core
+
+ezdxf = pytest.importorskip("ezdxf")
+
+
+@pytest.mark.parametrize("arcs", [False, True])
+def test_stream_dxf_reads_back_and_audits_clean(tmp_path, arcs):
+    prof = core.calculate_profile(17, 6.0, 38.0, 600)
+    arc_prof = core.calculate_arc_profile(17, 6.0, 38.0, 0.01) if arcs else None
+    path = str(tmp_path / "stream.dxf")
+    core.write_dxf(path, prof, 81.0, arc_prof=arc_prof, backend="stream")
+
+    doc = ezdxf.readfile(path)
+    auditor = doc.audit()
+    assert not auditor.errors
+    assert doc.dxfversion == "AC1009"
+
+    # Слой, цвет и тип линии каждого объекта - как в DXF_LAYERS
+    layers = {name: (color, linetype) for name, color, linetype in core.DXF_LAYERS}
+    entities = list(doc.modelspace())
+    assert {entity.dxf.layer for entity in entities} == set(layers)
+    for entity in entities:
+        assert (entity.dxf.color, entity.dxf.linetype) == layers[entity.dxf.layer]
+
+    base = next(entity for entity in entities if entity.dxftype() == "POLYLINE" and entity.dxf.layer == "BASE")
+    if arcs:
+        assert base.is_closed
+        vertices = np.array([(v.dxf.location.x, v.dxf.location.y, v.dxf.bulge) for v in base.vertices])
+        assert np.allclose(vertices, arc_prof["xyb"])
+    else:
+        vertices = np.array([(v.dxf.location.x, v.dxf.location.y) for v in base.vertices])
+        assert np.allclose(vertices, np.stack((prof["x"], prof["y"]), axis=1))
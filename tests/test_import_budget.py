@@ -0,0 +1,33 @@
+import os
+import sys
+import subprocess
+
+# Допустимое время импорта модуля без окна, мс (вместе с NumPy)
+IMPORT_TIME_BUDGET_MS = 300
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_IMPORT_PROBE = (
+    "import sys, time\n"
+    "start = time.perf_counter()\n"
+    "import BallsWaveGearingGenerator\n"
+    "print((time.perf_counter() - start) * 1000)\n"
+    "print(' '.join(sorted({m.split('.')[0] for m in sys.modules} & {'PyQt6', 'ezdxf'})))\n"
+)
+
+
+def measure_import(repeat=3):
+    # Импорт в чистом процессе; лучшее время из repeat запусков и загруженные тяжёлые модули
+    best = None
+    heavy = []
+    for _ in range(repeat):
+        output = subprocess.run([sys.executable, "-c", _IMPORT_PROBE], capture_output=True, text=True, check=True,
+                                cwd=ROOT).stdout.split("\n")
+        elapsed = float(output[0])
+        best = elapsed if best is None else min(best, elapsed)
+        heavy = output[1].split()
+    return best, heavy
+
+
+def test_import_is_fast_and_headless():
+    elapsed, heavy = measure_import()
+    assert heavy == [], f"при импорте загружены {', '.join(heavy)}"
+    assert elapsed <= IMPORT_TIME_BUDGET_MS, f"импорт {elapsed:.1f} мс, бюджет {IMPORT_TIME_BUDGET_MS} мс"
@@ -0,0 +1,89 @@
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import BallsWaveGearingGenerator as core
+
+
+def reference_profile(i, dsh, Rout, resolution):
+    # Исходная формула из окна программы: один вариант, равномерная сетка np.linspace
+    return reference_curve(i, dsh, Rout, np.linspace(0, 2 * np.pi, resolution))
+
+
+def reference_curve(i, dsh, Rout, theta):
+    e = 0.2 * dsh
+    zg = i + 1
+    rsh = dsh / 2
+    rd = Rout - 2 * e + e - dsh
+    S = np.sqrt((rsh + rd) ** 2 - np.power(e * np.sin(zg * theta), 2))
+    l = e * np.cos(zg * theta) + S
+    Xi = np.arctan2(e * zg * np.sin(zg * theta), S)
+    return l * np.sin(theta) + rsh * np.sin(theta + Xi), l * np.cos(theta) + rsh * np.cos(theta + Xi)
+
+
+def test_batched_profiles_match_reference_formula():
+    variants = [(5, 3.0, 20.0, 100), (17, 6.0, 38.0, 600), (40, 4.0, 60.0, 2000)]
+    i, dsh, Rout, resolution = (np.array(column) for column in zip(*variants))
+    prof = core.calculate_profiles(i, dsh, Rout, resolution)
+    for row, (vi, vdsh, vRout, vres) in enumerate(variants):
+        x, y = reference_profile(vi, vdsh, vRout, vres)
+        assert prof["n"][row] == vres
+        assert np.allclose(prof["x"][row, :vres], x, rtol=0, atol=1e-12)
+        assert np.allclose(prof["y"][row, :vres], y, rtol=0, atol=1e-12)
+        # Дополнение до общей длины - NaN
+        assert np.isnan(prof["x"][row, vres:]).all()
+
+
+def test_invalid_rows_are_empty():
+    min_Rout = float(core.calculate_dimensions(17, 6.0, 0.0)["min_Rout"])
+    prof = core.calculate_profiles([17, 17], [6.0, 6.0], [min_Rout, min_Rout + 1], 600)
+    assert list(prof["valid"]) == [False, True]
+    assert prof["n"][0] == 0
+    assert np.isnan(prof["x"][0]).all() and np.isnan(prof["y"][0]).all()
+    assert core.calculate_profile(17, 6.0, min_Rout - 1, 600)["x"].size == 0
+
+
+def max_chord_deviation(i, dsh, Rout, prof, samples=50):
+    # Отклонение кривой от хорд между соседними точками профиля по промежуточным значениям theta
+    t = np.linspace(0, 1, samples)
+    x, y = reference_curve(i, dsh, Rout, prof["theta"][:-1, None] + np.diff(prof["theta"])[:, None] * t)
+    x0, y0 = prof["x"][:-1, None], prof["y"][:-1, None]
+    dx, dy = np.diff(prof["x"])[:, None], np.diff(prof["y"])[:, None]
+    return (np.abs(dx * (y - y0) - dy * (x - x0)) / np.hypot(dx, dy)).max()
+
+
+def test_adaptive_profile_meets_tolerance_with_fewer_points():
+    tolerance = 0.01
+    prof = core.calculate_adaptive_profile(17, 6.0, 38.0, tolerance)
+    assert prof["chord_error"] <= tolerance
+    assert max_chord_deviation(17, 6.0, 38.0, prof) <= tolerance * 1.01
+
+    # Равномерной сетке с заметно большим числом точек допуска всё ещё не хватает
+    uniform = core.calculate_profile(17, 6.0, 38.0, int(prof["n"] * 1.3))
+    assert max_chord_deviation(17, 6.0, 38.0, uniform) > tolerance
+
+
+def test_arc_profile_within_tolerance_and_tangent_continuous():
+    tolerance = 0.01
+    prof = core.calculate_arc_profile(17, 6.0, 38.0, tolerance)
+    assert prof["arc_error"] <= tolerance
+
+    # Расстояние от точек кривой до дуг, включая точки между вершинами разных зубьев
+    p0, p1, bulge = core.profile_segments(prof)
+    x, y = reference_profile(17, 6.0, 38.0, 18 * 500 + 1)
+    points = np.stack((x, y), axis=1)
+    dist = np.concatenate([core.segment_distance(p0, p1, bulge, chunk[:, None]).min(axis=1)
+                           for chunk in np.array_split(points, 20)])
+    assert dist.max() <= tolerance
+
+    # Касательная дуги с bulge = tan(a/4) отклонена от хорды на a/2: в начале назад, в конце вперёд.
+    # Конец каждой дуги и начало следующей (в том числе на стыках зубьев) должны совпадать по направлению
+    chord = np.arctan2(p1[:, 1] - p0[:, 1], p1[:, 0] - p0[:, 0])
+    half = 2 * np.arctan(bulge)
+    jump = np.angle(np.exp(1j * (np.roll(chord - half, -1) - (chord + half))))
+    assert np.abs(jump).max() < 1e-9
+    lobe = len(bulge) // 18
+    assert np.abs(jump[lobe - 1::lobe]).max() < 1e-9
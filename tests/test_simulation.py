@@ -0,0 +1,51 @@
+import os
+import json
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import BallsWaveGearingGenerator as core
+
+
+def test_segment_distance_matches_sampled_arc():
+    rng = np.random.default_rng(0)
+    for _ in range(200):
+        p0, p1, q = rng.normal(size=2), rng.normal(size=2), rng.normal(size=2) * 2
+        bulge = rng.uniform(-0.99, 0.99)
+        # Та же дуга, заданная центром и углом 4*atan(bulge), плотно по точкам
+        c = p1 - p0
+        length = np.hypot(*c)
+        center = (p0 + p1) / 2 + length * (1 - bulge ** 2) / (4 * bulge) * np.array([-c[1], c[0]]) / length
+        radius = length * (1 + bulge ** 2) / (4 * abs(bulge))
+        start = np.arctan2(*(p0 - center)[::-1])
+        t = start + np.linspace(0, 4 * np.arctan(bulge), 20001)
+        points = center + radius * np.stack((np.cos(t), np.sin(t)), axis=1)
+        expected = np.hypot(*(points - q).T).min()
+        assert abs(core.segment_distance(p0, p1, bulge, q) - expected) < 1e-5
+
+
+def test_clearance_measured_against_exported_profile():
+    # Хорды RESOLUTION=600 срезают впадины профиля - шарик заходит в записанную ломаную
+    coarse = core.simulate_kinematics(17, 6.0, 38.0, core.calculate_profile(17, 6.0, 38.0, 600))
+    fine = core.simulate_kinematics(17, 6.0, 38.0, core.calculate_profile(17, 6.0, 38.0, 2000))
+    assert coarse["min_clearance"]["profile"] < -0.01
+    assert coarse["min_clearance"]["profile"] < fine["min_clearance"]["profile"] < 0
+
+    arc_prof = core.calculate_arc_profile(17, 6.0, 38.0, 0.01)
+    arcs = core.simulate_kinematics(17, 6.0, 38.0, arc_prof)
+    assert -arc_prof["arc_error"] - 1e-4 <= arcs["min_clearance"]["profile"] < 0
+
+
+def test_single_ball_has_no_neighbour_clearance():
+    # None, а не inf: значение попадает в manifest.json
+    sim = core.simulate_kinematics(1, 6.0, 60.0, core.calculate_profile(1, 6.0, 60.0, 600))
+    assert sim["min_clearance"]["balls"] is None
+    assert json.loads(json.dumps(sim["min_clearance"]))["balls"] is None
+
+
+def test_passed_profile_does_not_touch_shared_cache():
+    core.profile_cache.clear()
+    core.simulate_kinematics(17, 6.0, 38.0, core.calculate_profile(17, 6.0, 38.0, 600))
+    assert core.profile_cache.stats()["size"] == 0